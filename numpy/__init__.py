@@ -7,6 +7,10 @@ from typing import Iterable, List, Sequence
 
 nan = float("nan")
 
+# Scalar type names; optional extensions such as fastnumbers look these up on import.
+int8 = uint8 = int16 = uint16 = int32 = uint32 = int64 = uint64 = int_ = int
+float32 = float64 = float
+
 
 class ndarray(list):
     """Lightweight ndarray replacement."""
@@ -38,6 +42,20 @@ def clip(values: Iterable[float] | float, a_min: float | None = None, a_max: flo
     return result
 
 
+def trunc(values: Iterable[float] | float):
+    try:
+        iterator = iter(values)  # type: ignore[arg-type]
+    except TypeError:
+        return trunc_scalar(values)  # type: ignore[arg-type]
+    return [trunc_scalar(value) for value in iterator]
+
+
+def trunc_scalar(value: float) -> float:
+    if not isinstance(value, (int, float)) or math.isnan(value) or math.isinf(value):
+        return value
+    return float(math.trunc(value))
+
+
 def log10(value: float) -> float:
     return math.log10(value)
 
@@ -107,8 +125,20 @@ def sign(value: float) -> int:
 
 __all__ = [
     "nan",
+    "int8",
+    "uint8",
+    "int16",
+    "uint16",
+    "int32",
+    "uint32",
+    "int64",
+    "uint64",
+    "int_",
+    "float32",
+    "float64",
     "array",
     "clip",
+    "trunc",
     "log10",
     "log",
     "exp",
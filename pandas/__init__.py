@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import csv
+import io
 import math
+import re
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
@@ -76,6 +78,9 @@ class Series:
     def __sub__(self, other: Any) -> "Series":
         return self._binary_op(other, lambda a, b: a - b)
 
+    def __rsub__(self, other: Any) -> "Series":
+        return self._binary_op(other, lambda a, b: b - a)
+
     def __mul__(self, other: Any) -> "Series":
         return self._binary_op(other, lambda a, b: a * b)
 
@@ -100,6 +105,15 @@ class Series:
     def __ne__(self, other: Any) -> "Series":  # type: ignore[override]
         return self._comparison_op(other, lambda a, b: a != b)
 
+    def __and__(self, other: Any) -> "Series":
+        return self._binary_op(other, lambda a, b: bool(a) and bool(b))
+
+    def __or__(self, other: Any) -> "Series":
+        return self._binary_op(other, lambda a, b: bool(a) or bool(b))
+
+    def __invert__(self) -> "Series":
+        return Series([not item for item in self._data], index=self._index)
+
     def _binary_op(self, other: Any, op: Callable[[Any, Any], Any]) -> "Series":
         if isinstance(other, Series):
             data = [op(a, b) for a, b in zip(self._data, other._data)]
@@ -123,8 +137,42 @@ class Series:
     def fillna(self, value: Any) -> "Series":
         return Series([value if _is_nan(item) else item for item in self._data], index=self._index)
 
+    _DTYPE_NAMES: Dict[str, Callable[[Any], Any]] = {
+        "string": str,
+        "str": str,
+        "float": float,
+        "float64": float,
+        "int": int,
+        "int64": int,
+        "object": lambda item: item,
+    }
+
     def astype(self, typ: Any) -> "Series":
-        return Series([typ(item) if not _is_nan(item) else item for item in self._data], index=self._index)
+        if typ is object:
+            typ = "object"
+        convert = self._DTYPE_NAMES.get(typ, typ) if isinstance(typ, str) else typ
+        missing = np.nan if convert is float else None
+        return Series(
+            [convert(item) if not _is_nan(item) else (item if missing is None else missing) for item in self._data],
+            index=self._index,
+        )
+
+    def isin(self, values: Iterable[Any]) -> "Series":
+        lookup = set(values)
+        return Series([item in lookup for item in self._data], index=self._index)
+
+    def where(self, cond: Any, other: Any = np.nan) -> "Series":
+        flags = list(cond)
+        others = list(other) if isinstance(other, Series) else [other] * len(self._data)
+        data = [item if flag else alt for item, flag, alt in zip(self._data, flags, others)]
+        return Series(data, index=self._index)
+
+    def mask(self, cond: Any, other: Any = np.nan) -> "Series":
+        return self.where([not flag for flag in cond], other)
+
+    @property
+    def str(self) -> "_StringMethods":
+        return _StringMethods(self)
 
     def dropna(self) -> "Series":
         data = [item for item in self._data if not _is_nan(item)]
@@ -223,6 +271,45 @@ class Series:
         return f"Series({self._data})"
 
 
+class _StringMethods:
+    """Subset of the ``Series.str`` accessor; missing values pass through."""
+
+    def __init__(self, series: Series) -> None:
+        self._series = series
+
+    def _apply(self, func: Callable[[str], Any]) -> Series:
+        return self._series.map(lambda item: item if _is_nan(item) else func(item))
+
+    def strip(self, chars: Optional[str] = None) -> Series:
+        return self._apply(lambda item: item.strip(chars))
+
+    def rstrip(self, chars: Optional[str] = None) -> Series:
+        return self._apply(lambda item: item.rstrip(chars))
+
+    def upper(self) -> Series:
+        return self._apply(str.upper)
+
+    def extract(self, pat: str, expand: bool = True) -> "DataFrame":
+        regex = re.compile(pat)
+        groups = regex.groups
+        columns: Dict[Any, List[Any]] = {idx: [] for idx in range(groups)}
+        for item in self._series:
+            match = None if _is_nan(item) else regex.search(item)
+            for idx in range(groups):
+                value = match.group(idx + 1) if match is not None else None
+                columns[idx].append(np.nan if value is None else value)
+        frame = DataFrame(columns)
+        frame._index = list(self._series.index)
+        for column in frame._data.values():
+            column._index = list(self._series.index)
+        return frame
+
+    def replace(self, pat: str, repl: str, regex: bool = False) -> Series:
+        if regex:
+            raise NotImplementedError("Only literal replacement supported in this shim")
+        return self._apply(lambda item: item.replace(pat, repl))
+
+
 class DataFrame:
     """A minimal DataFrame implementation for the project."""
 
@@ -493,7 +580,12 @@ def to_numeric(data: Any, errors: str = "raise") -> Series:
     return Series(converted, index=series.index)
 
 
-def read_csv(path: Path | str) -> DataFrame:
+def read_csv(path: Any, engine: Optional[str] = None, dtype_backend: Optional[str] = None) -> DataFrame:
+    if hasattr(path, "read"):
+        content = path.read()
+        text = content.decode("utf-8") if isinstance(content, bytes) else content
+        rows = [row for row in csv.DictReader(io.StringIO(text))]
+        return DataFrame(rows)
     with open(path, "r", encoding="utf-8") as fh:
         reader = csv.DictReader(fh)
         rows = [row for row in reader]
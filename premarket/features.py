@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import math
-from typing import Any
+from typing import Any, Callable
 
 import numpy as np
 import pandas as pd
@@ -102,6 +102,13 @@ def _analyst_score(value: Any) -> float:
     return 0.0
 
 
+def _map_distinct(series: pd.Series, func: Callable[[Any], float]) -> list[float]:
+    """Apply ``func`` once per distinct value of a low-cardinality column."""
+    values = series.tolist()
+    lookup = {value: func(value) for value in set(values)}
+    return [lookup[value] for value in values]
+
+
 def _insider_inst_score(insider: Any, institutional: Any) -> float:
     insider_pct = utils.safe_percent(insider) or 0.0
     inst_pct = utils.safe_percent(institutional) or 0.0
@@ -157,7 +164,7 @@ def build_features(df: pd.DataFrame, cfg: Any) -> pd.DataFrame:
     result["f_short_float"] = short_float.map(_short_float_score)
 
     analyst = result.get("analyst_recom", pd.Series(None, index=index))
-    result["f_analyst"] = analyst.map(_analyst_score)
+    result["f_analyst"] = _map_distinct(analyst, _analyst_score)
 
     insider = result.get("insider_transactions", pd.Series(None, index=index))
     inst = result.get("institutional_transactions", pd.Series(None, index=index))
@@ -28,8 +28,11 @@ class FilterConfig:
 _DEF_EXCHANGES: Tuple[str, ...] = ("OTC",)
 
 
-def _should_exclude(value: Any, collection: Iterable[str]) -> bool:
-    values = {v.upper() for v in collection}
+def _upper_set(collection: Iterable[str]) -> frozenset[str]:
+    return frozenset(v.upper() for v in collection)
+
+
+def _should_exclude(value: Any, values: frozenset[str]) -> bool:
     if not values:
         return False
     if value is None:
@@ -44,8 +47,9 @@ def apply_hard_filters(df: pd.DataFrame, cfg: FilterConfig) -> Tuple[pd.DataFram
     rejected_records = []
     now = utils.now_eastern().date()
 
-    exclude_exchanges = tuple(cfg.exclude_exchanges) or _DEF_EXCHANGES
-    exclude_countries = tuple(cfg.exclude_countries)
+    # Upper-case the exclusion lists once instead of once per row.
+    exclude_exchanges = _upper_set(tuple(cfg.exclude_exchanges) or _DEF_EXCHANGES)
+    exclude_countries = _upper_set(cfg.exclude_countries)
 
     for _, row in df.iterrows():
         record = row.to_dict()
@@ -3,21 +3,33 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta, timezone
+import os
+import shutil
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 from urllib import request as urllib_request
 from urllib.error import HTTPError, URLError
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import RetryError, retry, stop_after_attempt, wait_exponential
 
 from . import utils
 
 LOGGER = logging.getLogger(__name__)
 
+# Shared session so tenacity retries and repeated runs reuse pooled connections
+# instead of paying for a fresh TCP + TLS handshake on every attempt.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0))
 
+_CHUNK_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=None)
 def _cache_ttl_minutes() -> int:
     value = utils.env_str("CACHE_TTL_MIN")
     if value is None:
@@ -28,25 +40,37 @@ def _cache_ttl_minutes() -> int:
         return 60
 
 
-def _fetch_with_requests(url: str) -> str:
-    response = requests.get(url, timeout=15)
-    response.raise_for_status()
-    return response.text
+def _stream_to_path(stream: BinaryIO, out_path: Path) -> None:
+    """Copy a binary stream to ``out_path`` in fixed-size chunks.
+
+    Bytes are written to a sibling ``.part`` file that only replaces
+    ``out_path`` once the transfer completes, so an interrupted download never
+    leaves a truncated CSV behind for the cache fallback to pick up.
+    """
+    utils.ensure_directory(out_path.parent)
+    tmp_path = out_path.with_name(f"{out_path.name}.part")
+    try:
+        with tmp_path.open("wb") as fh:
+            shutil.copyfileobj(stream, fh, length=_CHUNK_SIZE)
+        os.replace(tmp_path, out_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _fetch_with_requests(url: str, out_path: Path) -> None:
+    with _SESSION.get(url, timeout=15, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        _stream_to_path(response.raw, out_path)
 
 
-def _fetch_with_urllib(url: str) -> str:
+def _fetch_with_urllib(url: str, out_path: Path) -> None:
     try:
         with urllib_request.urlopen(url, timeout=15) as response:  # type: ignore[arg-type]
             status = getattr(response, "status", 200)
             if status and status >= 400:
                 raise requests.RequestException(f"HTTP {status}")
-            headers = getattr(response, "headers", None)
-            if headers is not None:
-                encoding = headers.get_content_charset() or "utf-8"
-            else:
-                encoding = "utf-8"
-            content = response.read()
-            return content.decode(encoding, errors="replace")
+            _stream_to_path(response, out_path)
     except (HTTPError, URLError, OSError) as exc:  # pragma: no cover - defensive
         raise requests.RequestException(str(exc)) from exc
 
@@ -56,57 +80,70 @@ def _is_stub_network_error(exc: Exception) -> bool:
 
 
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=8))
-def _http_get(url: str) -> str:
+def _http_download(url: str, out_path: Path) -> Path:
     try:
-        return _fetch_with_requests(url)
+        _fetch_with_requests(url, out_path)
     except requests.RequestException as exc:
-        if _is_stub_network_error(exc):
-            LOGGER.info("requests stub detected, retrying download via urllib")
-            return _fetch_with_urllib(url)
-        raise
+        if not _is_stub_network_error(exc):
+            raise
+        LOGGER.info("requests stub detected, retrying download via urllib")
+        _fetch_with_urllib(url, out_path)
+    return out_path
 
 
-def _latest_cached_file(base_dir: Path) -> Optional[Path]:
-    if not base_dir.exists():
-        return None
-    candidates = sorted(base_dir.glob("*/finviz_elite.csv"))
-    if not candidates:
+def _latest_cached_file(base_dir: Path) -> Optional[tuple[Path, float]]:
+    """Return the newest cached export together with its modification time."""
+    try:
+        with os.scandir(base_dir) as entries:
+            dated_dirs = [entry.name for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
         return None
-    return candidates[-1]
+    # Run directories are ISO dates, so reverse lexicographic order is newest first.
+    dated_dirs.sort(reverse=True)
+    for name in dated_dirs:
+        candidate = base_dir / name / "finviz_elite.csv"
+        try:
+            return candidate, os.stat(candidate).st_mtime
+        except OSError:
+            continue
+    return None
 
 
 def download_csv(url: str, out_path: Path, use_cache: bool) -> Path:
     """Download the CSV, falling back to cache if necessary."""
-    utils.ensure_directory(out_path.parent)
-
     try:
         LOGGER.info("Downloading Finviz CSV from %s", utils.redact_token(url))
-        content = _http_get(url)
-        out_path.write_text(content, encoding="utf-8")
-        return out_path
+        return _http_download(url, out_path)
     except (requests.RequestException, RetryError) as exc:
         LOGGER.warning("Download failed: %s", exc)
         if use_cache:
-            fallback = _latest_cached_file(out_path.parent.parent)
-            if fallback is not None:
+            cached = _latest_cached_file(out_path.parent.parent)
+            fallback = None
+            if cached is not None:
+                fallback, modified = cached
                 ttl_minutes = _cache_ttl_minutes()
-                if ttl_minutes > 0:
-                    ttl = timedelta(minutes=ttl_minutes)
-                    modified = datetime.fromtimestamp(fallback.stat().st_mtime, tz=timezone.utc)
-                    age = datetime.now(timezone.utc) - modified
-                    if age > ttl:
-                        LOGGER.warning(
-                            "Cached CSV at %s is older than %s minutes; ignoring",
-                            fallback,
-                            ttl_minutes,
-                        )
-                        fallback = None
+                if ttl_minutes > 0 and time.time() - modified > ttl_minutes * 60:
+                    LOGGER.warning(
+                        "Cached CSV at %s is older than %s minutes; ignoring",
+                        fallback,
+                        ttl_minutes,
+                    )
+                    fallback = None
             if fallback is not None:
                 LOGGER.warning("Falling back to cached CSV at %s", fallback)
                 return fallback
         raise RuntimeError("Download failed and no cached CSV available") from exc
 
 
-def read_csv(path: Path) -> pd.DataFrame:
-    """Read a CSV file into a DataFrame."""
-    return pd.read_csv(path)
+def read_csv(source: Path | BinaryIO) -> pd.DataFrame:
+    """Read a CSV file or in-memory bytes buffer into a DataFrame.
+
+    The multithreaded PyArrow parser (with Arrow-backed dtypes) is used when
+    pyarrow is installed; otherwise pandas' default C parser is used.
+    """
+    try:
+        return pd.read_csv(source, engine="pyarrow", dtype_backend="pyarrow")
+    except ImportError:
+        if hasattr(source, "seek"):
+            source.seek(0)
+        return pd.read_csv(source)
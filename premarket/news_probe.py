@@ -265,7 +265,11 @@ def _merge_sources(
 
 
 def probe(symbols: Iterable[str], cfg) -> Dict[str, dict]:
-    """Probe Finviz and Finnhub news sources for the provided symbols."""
+    """Probe Finviz and Finnhub news sources for the provided symbols.
+
+    Symbols without any headline all map to one shared payload dict, so
+    callers must treat the returned payloads as read-only.
+    """
 
     normalized = _normalise_symbols(symbols)
     now = utils.now_eastern()
@@ -278,15 +282,16 @@ def probe(symbols: Iterable[str], cfg) -> Dict[str, dict]:
     finnhub_data = _finnhub_latest(normalized, finnhub_token, finnhub_days)
     merged = _merge_sources(normalized, finviz_data, finnhub_data)
 
+    no_news = {
+        "freshness_hours": None,
+        "category": None,
+        "timestamp": utils.timestamp_iso(now),
+    }
     results: Dict[str, dict] = {}
     for symbol in normalized:
         payload = merged.get(symbol)
         if payload is None:
-            results[symbol] = {
-                "freshness_hours": None,
-                "category": None,
-                "timestamp": utils.timestamp_iso(now),
-            }
+            results[symbol] = no_news
             continue
 
         timestamp, category = payload
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime, time
+from functools import lru_cache
 from typing import Dict
 
 import numpy as np
@@ -44,6 +45,8 @@ for canonical, aliases in _CANONICAL_MAP.items():
     for alias in aliases:
         COLUMN_ALIASES[alias.lower()] = canonical
 
+_CANONICAL_COLUMNS = frozenset(_CANONICAL_MAP)
+
 
 FLOAT_COLUMNS = {
     "price",
@@ -72,24 +75,66 @@ PERCENT_COLUMNS = {
 }
 
 
+@lru_cache(maxsize=None)
+def _canonical_column(name: str) -> str:
+    key = name.strip().lower()
+    canonical = COLUMN_ALIASES.get(key)
+    if canonical is None:
+        canonical = key.replace(" ", "_")
+    return canonical
+
+
 def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Normalize column names to canonical keys."""
-    rename_map = {}
-    for col in df.columns:
-        key = col.strip().lower()
-        canonical = COLUMN_ALIASES.get(key)
-        if canonical is None:
-            canonical = key.replace(" ", "_")
-        rename_map[col] = canonical
+    """Normalize column names to canonical keys.
+
+    Frames whose columns are already all canonical are returned unchanged.
+    """
+    if _CANONICAL_COLUMNS.issuperset(df.columns):
+        return df
+    rename_map = {col: _canonical_column(col) for col in df.columns}
     normalized = df.rename(columns=rename_map)
     return normalized
 
 
+_NA_TEXT = ("", "-", "N/A", "NA")
+# Mirrors ``utils.parse_range``: exactly two non-blank '-'-separated parts.
+_RANGE_PATTERN = r"^[\s-]*([^-\s](?:[^-]*[^-\s])?)\s*-[\s-]*([^-\s](?:[^-]*[^-\s])?)[\s-]*$"
+# Dropped with literal ``str.replace`` calls, which run as Arrow kernels on
+# ``string[pyarrow]`` columns; ``str.translate`` falls back to per-cell Python.
+_NUMERIC_NOISE = (",", "$")
+
+
+def _parse_numeric(series: pd.Series) -> pd.Series:
+    """Parse a column of Finviz numbers into floats.
+
+    Plain numbers, percentages, currency and thousands separators go through
+    ``pd.to_numeric`` in one pass; cells it rejects (suffixes, parentheses)
+    fall back to :func:`utils.safe_float`.
+    """
+    text = series.astype("string").str.strip()
+    cleaned = text.str.rstrip("%")
+    for char in _NUMERIC_NOISE:
+        cleaned = cleaned.str.replace(char, "", regex=False)
+    parsed = pd.to_numeric(cleaned, errors="coerce").astype(float)
+    missed = parsed.isna() & text.notna()
+    if missed.any():
+        # Only columns with unparsed cells pay for the NA-token scan.
+        leftover = missed & ~text.str.upper().isin(_NA_TEXT)
+        if leftover.any():
+            parsed = parsed.mask(leftover, series.where(leftover).map(utils.safe_float))
+    return parsed.astype(float)
+
+
 def _parse_datetime(value: object) -> object:
-    if value in (None, "", "-"):
+    # Arrow-backed columns deliver blank cells as ``pd.NA``, which cannot be
+    # compared with ``in``.
+    if value is None or pd.isna(value) or value in ("", "-"):
         return None
     if isinstance(value, datetime):
         return value
+    if isinstance(value, date):
+        # The Arrow CSV reader already delivers typed dates.
+        return datetime.combine(value, time.min)
     try:
         return parser.parse(str(value))
     except (parser.ParserError, TypeError, ValueError):
@@ -102,44 +147,33 @@ def coerce_types(df: pd.DataFrame) -> tuple[pd.DataFrame, int]:
     warnings = 0
 
     for col in set(result.columns) & FLOAT_COLUMNS:
-        if col in PERCENT_COLUMNS:
-            result[col] = result[col].map(utils.safe_percent)
-        else:
-            result[col] = result[col].map(utils.safe_float)
+        result[col] = _parse_numeric(result[col])
 
     for col in set(result.columns) & INT_COLUMNS:
-        result[col] = result[col].map(utils.safe_int)
+        parsed = _parse_numeric(result[col])
+        # Truncate like ``int()``; gapless columns become real integers.
+        result[col] = parsed.astype("int64") if parsed.notna().all() else np.trunc(parsed)
 
     if "earnings_date" in result.columns:
         result["earnings_date"] = result["earnings_date"].map(_parse_datetime)
 
     if "previous_close" in result.columns:
-        result["previous_close"] = result["previous_close"].map(utils.safe_float)
+        result["previous_close"] = _parse_numeric(result["previous_close"])
 
     if "price" in result.columns and "gap_pct" not in result.columns:
         result["gap_pct"] = np.nan
 
-    if "gap_pct" in result.columns:
-        result["gap_pct"] = result["gap_pct"].map(utils.safe_percent)
-
     if "gap_pct" in result.columns and result["gap_pct"].isna().all():
         if "price" in result.columns and "previous_close" in result.columns:
-            price_series = result["price"].map(utils.safe_float)
-            prev_series = result["previous_close"].map(utils.safe_float)
-            computed: list[float] = []
-            for price_value, prev_value in zip(price_series, prev_series):
-                if (
-                    price_value is not None
-                    and prev_value is not None
-                    and prev_value != 0
-                ):
-                    computed.append((price_value - prev_value) / prev_value * 100)
-                else:
-                    computed.append(np.nan)
-            result["gap_pct"] = pd.Series(computed, index=result.index)
+            previous = result["previous_close"]
+            previous = previous.where(previous != 0)
+            result["gap_pct"] = (result["price"] - previous) / previous * 100
 
     if "week52_range" in result.columns:
-        result["week52_range"] = result["week52_range"].astype(str)
+        ranges = result["week52_range"]
+        # Arrow-backed blanks are ``pd.NA``; route them through NaN so they
+        # stringify as before instead of as "<NA>".
+        result["week52_range"] = ranges.astype(object).where(ranges.notna(), np.nan).astype(str)
         week_pos, warnings = compute_week52_pos(result)
         result["week52_pos"] = week_pos
     else:
@@ -148,6 +182,14 @@ def coerce_types(df: pd.DataFrame) -> tuple[pd.DataFrame, int]:
     return result, warnings
 
 
+def _rejected(values: pd.Series, parsed: pd.Series) -> pd.Series:
+    """Flag cells :func:`utils.safe_float` rejects; a literal "nan" still parses."""
+    missing = parsed.isna()
+    if not missing.any():
+        return missing
+    return missing & values.where(missing).map(lambda value: utils.safe_float(value) is None)
+
+
 def compute_week52_pos(df: pd.DataFrame) -> tuple[pd.Series, int]:
     """Compute the position of price within the 52-week range."""
     prices = df.get("price")
@@ -155,22 +197,21 @@ def compute_week52_pos(df: pd.DataFrame) -> tuple[pd.Series, int]:
     if prices is None or ranges is None:
         return pd.Series(np.nan, index=df.index), 0
 
-    positions: list[float] = []
-    warnings = 0
-    for _, row in df.iterrows():
-        price = utils.safe_float(row.get("price"))
-        range_str = row.get("week52_range")
-        parsed = utils.parse_range(range_str)
-        if price is None or parsed is None:
-            warnings += 1
-            positions.append(0.5)
-            continue
-        low, high = parsed
-        if high <= low:
-            warnings += 1
-            positions.append(0.5)
-            continue
-        position = (price - low) / (high - low)
-        positions.append(float(np.clip(position, 0.0, 1.0)))
-
-    return pd.Series(positions, index=df.index, dtype=float), warnings
+    price = _parse_numeric(prices)
+    bounds = ranges.astype("string").str.extract(_RANGE_PATTERN, expand=True)
+    low = _parse_numeric(bounds[0])
+    high = _parse_numeric(bounds[1])
+
+    # Mirrors the per-row rules: an unparseable price or range, or one that is
+    # empty or inverted, falls back to the midpoint and counts as a warning.
+    # NaN bounds that did parse propagate into a NaN position instead.
+    unusable = (
+        _rejected(prices, price)
+        | bounds[0].isna()
+        | _rejected(bounds[0], low)
+        | _rejected(bounds[1], high)
+        | (high <= low)
+    )
+    position = ((price - low) / (high - low).where(~unusable)).clip(0.0, 1.0)
+    warnings = int(unusable.sum())
+    return position.where(~unusable, 0.5).astype(float), warnings
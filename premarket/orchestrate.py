@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import hashlib
+import io
 import logging
 import time
 from dataclasses import dataclass, field
 from datetime import date, datetime, time as dtime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -35,6 +37,36 @@ _FEATURE_LABELS = {
     "insider_inst": "Ins/Inst",
 }
 
+_FULL_WATCHLIST_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("symbol", "ticker"),
+    ("company", "company"),
+    ("sector", "sector"),
+    ("industry", "industry"),
+    ("exchange", "exchange"),
+    ("market_cap", "market_cap"),
+    ("pe", "pe"),
+    ("price", "price"),
+    ("change_pct", "change_pct"),
+    ("gap_pct", "gap_pct"),
+    ("volume", "volume"),
+    ("avg_volume_3m", "avg_volume_3m"),
+    ("rel_volume", "rel_volume"),
+    ("float_shares", "float_shares"),
+    ("short_float_pct", "short_float_pct"),
+    ("after_hours_change_pct", "after_hours_change_pct"),
+    ("week52_range", "week52_range"),
+    ("week52_pos", "f_52w_pos"),
+    ("earnings_date", "earnings_date"),
+    ("analyst_recom", "analyst_recom"),
+)
+
+_TAG_LABELS = {
+    "low_float": "LOW_FLOAT",
+    "extreme_gap": "EXTREME_GAP",
+    "earnings_today": "EARNINGS_TODAY",
+    "breakout": "FIFTY_TWO_WEEK_BREAKOUT",
+}
+
 WATCHLIST_COLUMNS = [
     "rank",
     "symbol",
@@ -148,8 +180,15 @@ class RunParams:
             return self.log_file
         return Path("logs") / f"premarket_{self.run_date.isoformat()}.log"
 
+@lru_cache(maxsize=8)
+def _read_config_data(path: str, mtime_ns: int) -> Any:
+    # ``mtime_ns`` is only part of the cache key so edits invalidate the entry.
+    return yaml.safe_load(Path(path).read_text())
+
+
 def _load_config(path: Path) -> StrategyConfig:
-    data = yaml.safe_load(path.read_text())
+    data = _read_config_data(str(path), path.stat().st_mtime_ns)
+    # Validation builds a fresh model each run, so callers never share one.
     return StrategyConfig.model_validate(data)
 
 
@@ -187,67 +226,197 @@ def _determine_log_path(log_file: Optional[Path], today: str) -> Path:
     return Path("logs") / f"premarket_{today}.log"
 
 
-def _news_scores(symbols: list[str], news_cfg: NewsModel) -> Dict[str, float]:
+def _news_scores(symbols: list[str], news_cfg: NewsModel) -> pd.Series:
+    """Return news freshness scores in [0, 1] aligned with ``symbols``."""
     if not news_cfg.enabled or not symbols:
-        return {symbol: 0.0 for symbol in symbols}
+        return pd.Series(0.0, index=range(len(symbols)), dtype=float)
     raw = news_probe(symbols, news_cfg)
-    scores: Dict[str, float] = {}
-    for symbol, payload in raw.items():
-        freshness = payload.get("freshness_hours") if isinstance(payload, dict) else None
-        if freshness is None:
-            scores[symbol] = 0.0
-        else:
-            freshness = max(0.0, float(freshness))
-            normalized = max(0.0, 1 - min(freshness, news_cfg.freshness_hours) / news_cfg.freshness_hours)
-            scores[symbol] = float(np.clip(normalized, 0.0, 1.0))
-    return scores
-
-
-def _tags_for_row(row: pd.Series) -> list[str]:
-    tags: list[str] = []
-    float_shares = row.get("float_shares")
-    if float_shares is not None and float_shares < 20_000_000:
-        tags.append("LOW_FLOAT")
-    gap_pct = row.get("gap_pct")
-    if gap_pct is not None and gap_pct > 20:
-        tags.append("EXTREME_GAP")
-    earnings_date = row.get("earnings_date")
-    if hasattr(earnings_date, "date"):
-        if abs((earnings_date.date() - utils.now_eastern().date()).days) <= 1:
-            tags.append("EARNINGS_TODAY")
-    if row.get("f_52w_pos", 0.0) >= 0.80:
-        tags.append("FIFTY_TWO_WEEK_BREAKOUT")
-    return tags
-
-
-def _build_feature_dict(row: pd.Series) -> Dict[str, float]:
-    features_map: Dict[str, float] = {}
-    for col in row.index:
-        if not col.startswith("f_"):
-            continue
-        value = row[col]
-        if value is None or (isinstance(value, float) and np.isnan(value)):
-            features_map[col.replace("f_", "")] = 0.0
-        else:
-            features_map[col.replace("f_", "")] = float(value)
-    return features_map
+    payloads = [raw.get(symbol.strip().upper()) for symbol in symbols]
+    freshness = pd.to_numeric(
+        pd.Series(
+            [
+                payload.get("freshness_hours") if isinstance(payload, dict) else None
+                for payload in payloads
+            ]
+        ),
+        errors="coerce",
+    )
+    window = float(news_cfg.freshness_hours)
+    scores = 1 - freshness.clip(lower=0.0, upper=window) / window
+    return scores.fillna(0.0)
+
+
+def _compute_tag_masks(df: pd.DataFrame) -> Dict[str, list[bool]]:
+    index = df.index
+    float_shares = pd.to_numeric(
+        df.get("float_shares", pd.Series(np.nan, index=index)), errors="coerce"
+    )
+    gap_pct = pd.to_numeric(df.get("gap_pct", pd.Series(np.nan, index=index)), errors="coerce")
+    week_pos = pd.to_numeric(df.get("f_52w_pos", pd.Series(0.0, index=index)), errors="coerce")
+    earnings = df.get("earnings_date", pd.Series(None, index=index))
+    today = utils.now_eastern().date()
+    return {
+        "low_float": (float_shares < 20_000_000).tolist(),
+        "extreme_gap": (gap_pct > 20).tolist(),
+        "earnings_today": [
+            hasattr(value, "date") and pd.notna(value) and abs((value.date() - today).days) <= 1
+            for value in earnings
+        ],
+        "breakout": (week_pos >= 0.80).tolist(),
+    }
+
+
+def _tags_from_masks(masks: Dict[str, list[bool]]) -> list[list[str]]:
+    labels = list(_TAG_LABELS.values())
+    columns = [masks[key] for key in _TAG_LABELS]
+    return [
+        [label for label, flag in zip(labels, flags) if flag]
+        for flags in zip(*columns)
+    ]
+
+
+def _build_feature_dicts(df: pd.DataFrame) -> list[Dict[str, float]]:
+    names = [col for col in df.columns if col.startswith("f_")]
+    if not names:
+        return [{} for _ in range(len(df))]
+    keys = [name[2:] for name in names]
+    # ``value != value`` is the cheap scalar NaN check.
+    columns = [
+        [0.0 if value is None or value != value else float(value) for value in df[name].tolist()]
+        for name in names
+    ]
+    return [dict(zip(keys, values)) for values in zip(*columns)]
+
+
+def _build_full_watchlist(df: pd.DataFrame, generated_at: str) -> list[Dict[str, Any]]:
+    """Assemble the full watchlist payload column by column."""
+
+    size = len(df)
+    present = set(df.columns)
+
+    def column(name: str) -> list[Any]:
+        return df[name].tolist() if name in present else [None] * size
+
+    arrays: Dict[str, list[Any]] = {
+        key: column(name) for key, name in _FULL_WATCHLIST_COLUMNS
+    }
+    arrays["earnings_date"] = [
+        value.isoformat() if hasattr(value, "isoformat") else value
+        for value in arrays["earnings_date"]
+    ]
+    arrays["features"] = _build_feature_dicts(df)
+    arrays["score"] = column("score")
+    arrays["tier"] = column("tier")
+    for name in ("tags", "rejection_reasons"):
+        arrays[name] = column(name) if name in present else [[] for _ in range(size)]
+    arrays["generated_at"] = [generated_at] * size
+    for name in ("insider_transactions", "institutional_transactions", "week52_pos"):
+        if name in present:
+            arrays[name] = column(name)
+
+    keys = list(arrays)
+    return [dict(zip(keys, values)) for values in zip(*arrays.values())]
 
 
-def _feature_contributions(row: pd.Series, weights: ranker.RankerWeights) -> list[tuple[str, float]]:
-    contributions: list[tuple[str, float]] = []
+def _feature_contributions(df: pd.DataFrame, weights: ranker.RankerWeights) -> list[list[tuple[str, float]]]:
+    """Return each row's weighted feature contributions, largest first."""
+
+    labels: list[str] = []
+    columns: list[list[float]] = []
     for key, label in _FEATURE_LABELS.items():
         column = f"f_{key}"
-        if column not in row:
+        if column not in df.columns:
             continue
-        value = row.get(column)
-        if value is None or (isinstance(value, float) and np.isnan(value)):
-            contribution = 0.0
-        else:
-            weight = getattr(weights, key)
-            contribution = float(value) * float(weight)
-        contributions.append((label, contribution))
-    contributions.sort(key=lambda item: item[1], reverse=True)
-    return contributions
+        weighted = pd.to_numeric(df[column], errors="coerce") * float(getattr(weights, key))
+        labels.append(label)
+        columns.append(weighted.fillna(0.0).tolist())
+    if not columns:
+        return [[] for _ in range(len(df))]
+    return [
+        sorted(zip(labels, values), key=lambda item: item[1], reverse=True)
+        for values in zip(*columns)
+    ]
+
+
+@dataclass
+class TopNWatchlist:
+    """Ranked Top-N selection held as parallel columns."""
+
+    symbols: list[str]
+    scores: list[float]
+    tiers: list[str]
+    gap_pct: list[Any]
+    rel_volume: list[Any]
+    tags: list[list[str]]
+    why: list[str]
+    top_features: list[list[str]]
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, weights: ranker.RankerWeights) -> "TopNWatchlist":
+        contributions = _feature_contributions(df, weights)
+        why: list[str] = []
+        for items in contributions:
+            positive_labels = [label for label, value in items if value > 0][:3]
+            why.append(" + ".join(positive_labels) if positive_labels else "—")
+        top_features = [
+            [
+                f"{items[idx][0]}={items[idx][1]:.3f}" if idx < len(items) else ""
+                for items in contributions
+            ]
+            for idx in range(5)
+        ]
+        return cls(
+            symbols=df["ticker"].tolist(),
+            scores=df["score"].tolist(),
+            tiers=df["tier"].tolist(),
+            gap_pct=df["gap_pct"].tolist(),
+            rel_volume=df["rel_volume"].tolist(),
+            tags=df["tags"].tolist(),
+            why=why,
+            top_features=top_features,
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @property
+    def ranks(self) -> list[int]:
+        return list(range(1, len(self) + 1))
+
+    def columns(self) -> Dict[str, list[Any]]:
+        """Return the watchlist columns keyed in ``WATCHLIST_COLUMNS`` order."""
+
+        return {
+            "rank": self.ranks,
+            "symbol": self.symbols,
+            "score": self.scores,
+            "tier": self.tiers,
+            "gap_pct": self.gap_pct,
+            "rel_volume": self.rel_volume,
+            "tags": self.tags,
+            "Why": self.why,
+            **{f"TopFeature{idx}": values for idx, values in enumerate(self.top_features, start=1)},
+        }
+
+    def ranking(self) -> list[Dict[str, Any]]:
+        return [
+            {"symbol": symbol, "score": score}
+            for symbol, score in zip(self.symbols, self.scores)
+        ]
+
+    def top_n_records(self) -> list[Dict[str, Any]]:
+        return [
+            {"rank": rank, "symbol": symbol, "score": score}
+            for rank, symbol, score in zip(self.ranks, self.symbols, self.scores)
+        ]
+
+    def records(self) -> list[Dict[str, Any]]:
+        columns = self.columns()
+        keys = list(columns)
+        return [dict(zip(keys, values)) for values in zip(*columns.values())]
+
+    def table(self) -> pd.DataFrame:
+        return pd.DataFrame(self.columns(), columns=WATCHLIST_COLUMNS)
 
 
 def _timezone_label(tz_name: str, run_day: date) -> str:
@@ -299,18 +468,17 @@ def _emit_empty_outputs(
     run_summary: Dict[str, object],
     run_date: str,
 ) -> None:
-    persist.write_json([], output_dir / "full_watchlist.json")
-    persist.write_json(
-        {
+    persist.write_outputs(
+        output_dir,
+        full_watchlist=[],
+        top_n={
             "generated_at": generated_at,
             "top_n": requested_top_n,
             "symbols": [],
             "ranking": [],
         },
-        output_dir / "topN.json",
+        watchlist_df=pd.DataFrame(columns=WATCHLIST_COLUMNS),
     )
-    empty_table = pd.DataFrame(columns=WATCHLIST_COLUMNS)
-    persist.write_csv(empty_table, output_dir / "watchlist.csv")
     persist.write_json(run_summary, output_dir / "run_summary.json")
     persist.write_sqlite_outputs(
         run_date=run_date,
@@ -403,14 +571,17 @@ def run(params: RunParams) -> int:
     used_cached_csv = csv_path != raw_csv_path
     notes.append(f"used_cached_csv: {used_cached_csv}")
 
+    csv_bytes: Optional[bytes] = None
     try:
-        csv_hash = hashlib.sha256(csv_path.read_bytes()).hexdigest()
+        csv_bytes = csv_path.read_bytes()
+        csv_hash = hashlib.sha256(csv_bytes).hexdigest()
     except OSError:
         csv_hash = ""
         logger.warning("Unable to hash CSV at %s", csv_path)
 
     start = time.perf_counter()
-    df = loader_finviz.read_csv(csv_path)
+    # Parse the bytes already read for hashing instead of reading the file twice.
+    df = loader_finviz.read_csv(io.BytesIO(csv_bytes) if csv_bytes is not None else csv_path)
     raw_rows = len(df)
     df = normalize.normalize_columns(df)
     df, week52_warnings = normalize.coerce_types(df)
@@ -471,8 +642,7 @@ def run(params: RunParams) -> int:
 
     start = time.perf_counter()
     symbols = qualified_df.get("ticker", pd.Series(dtype=str)).fillna("").astype(str).tolist()
-    news_scores = _news_scores(symbols, news_cfg)
-    qualified_df["news_fresh_score"] = [news_scores.get(sym, 0.0) for sym in symbols]
+    qualified_df["news_fresh_score"] = _news_scores(symbols, news_cfg).tolist()
 
     featured_df = features.build_features(qualified_df, cfg)
 
@@ -485,6 +655,7 @@ def run(params: RunParams) -> int:
     featured_df.sort_values(
         by=["score", "turnover_dollar", "ticker"], ascending=[False, False, True], inplace=True
     )
+    featured_df["tags"] = _tags_from_masks(_compute_tag_masks(featured_df))
 
     diversified_df, sector_trimmed = ranker.apply_sector_diversity(
         featured_df, top_n=top_n_value, max_fraction=max_per_sector
@@ -517,94 +688,29 @@ def run(params: RunParams) -> int:
         logger.info(summary_line)
         return 2 if params.fail_on_empty else 0
 
-    diversified_df = diversified_df.head(top_n_value).copy()
-    diversified_df["rank"] = range(1, len(diversified_df) + 1)
-    diversified_df["tags"] = diversified_df.apply(_tags_for_row, axis=1)
-
-    rank_weights = rank_cfg.weights
-    why_values: list[str] = []
-    feature_columns: dict[int, list[str]] = {idx: [] for idx in range(1, 6)}
-    for _, row in diversified_df.iterrows():
-        contributions = _feature_contributions(row, rank_weights)
-        positive_labels = [label for label, value in contributions if value > 0][:3]
-        why_values.append(" + ".join(positive_labels) if positive_labels else "—")
-        for idx in range(5):
-            if idx < len(contributions):
-                label, value = contributions[idx]
-                feature_columns[idx + 1].append(f"{label}={value:.3f}")
-            else:
-                feature_columns[idx + 1].append("")
+    diversified_df = diversified_df.head(top_n_value)
+    top_watchlist = TopNWatchlist.from_frame(diversified_df, rank_cfg.weights)
 
     generated_at = utils.timestamp_iso()
 
-    full_watchlist = []
-    for _, row in featured_df.iterrows():
-        features_dict = _build_feature_dict(row)
-        item = {
-            "symbol": row.get("ticker"),
-            "company": row.get("company"),
-            "sector": row.get("sector"),
-            "industry": row.get("industry"),
-            "exchange": row.get("exchange"),
-            "market_cap": row.get("market_cap"),
-            "pe": row.get("pe"),
-            "price": row.get("price"),
-            "change_pct": row.get("change_pct"),
-            "gap_pct": row.get("gap_pct"),
-            "volume": row.get("volume"),
-            "avg_volume_3m": row.get("avg_volume_3m"),
-            "rel_volume": row.get("rel_volume"),
-            "float_shares": row.get("float_shares"),
-            "short_float_pct": row.get("short_float_pct"),
-            "after_hours_change_pct": row.get("after_hours_change_pct"),
-            "week52_range": row.get("week52_range"),
-            "week52_pos": row.get("f_52w_pos"),
-            "earnings_date": row.get("earnings_date").isoformat()
-            if hasattr(row.get("earnings_date"), "isoformat")
-            else row.get("earnings_date"),
-            "analyst_recom": row.get("analyst_recom"),
-            "features": features_dict,
-            "score": row.get("score"),
-            "tier": row.get("tier"),
-            "tags": _tags_for_row(row),
-            "rejection_reasons": row.get("rejection_reasons", []),
-            "generated_at": generated_at,
-        }
-        if "insider_transactions" in row:
-            item["insider_transactions"] = row.get("insider_transactions")
-        if "institutional_transactions" in row:
-            item["institutional_transactions"] = row.get("institutional_transactions")
-        if "week52_pos" in row:
-            item["week52_pos"] = row.get("week52_pos")
-        full_watchlist.append(item)
-
-    start = time.perf_counter()
-    persist.write_json(full_watchlist, output_dir / "full_watchlist.json")
+    full_watchlist = _build_full_watchlist(featured_df, generated_at)
 
-    top_symbols = diversified_df[["ticker", "score"]].rename(columns={"ticker": "symbol"})
-    top_symbols_list = top_symbols["symbol"].tolist()
-    persist.write_json(
-        {
-            "generated_at": generated_at,
-            "top_n": top_n_value,
-            "symbols": top_symbols_list,
-            "ranking": top_symbols.to_dict(orient="records"),
-        },
-        output_dir / "topN.json",
+    top_n_payload = {
+        "generated_at": generated_at,
+        "top_n": top_n_value,
+        "symbols": top_watchlist.symbols,
+        "ranking": top_watchlist.ranking(),
+    }
+    watchlist_table = top_watchlist.table()
+    timings["persist"] = persist.write_outputs(
+        output_dir,
+        full_watchlist=full_watchlist,
+        top_n=top_n_payload,
+        watchlist_df=watchlist_table,
     )
 
-    watchlist_table = diversified_df[
-        ["rank", "ticker", "score", "tier", "gap_pct", "rel_volume", "tags"]
-    ].rename(columns={"ticker": "symbol"})
-    watchlist_table = watchlist_table.copy()
-    watchlist_table["Why"] = why_values
-    for idx, values in feature_columns.items():
-        watchlist_table[f"TopFeature{idx}"] = values
-    persist.write_csv(watchlist_table, output_dir / "watchlist.csv")
-    timings["persist"] = time.perf_counter() - start
-
     tier_counts = diversified_df["tier"].value_counts().to_dict()
-    row_counts["topN"] = int(len(diversified_df))
+    row_counts["topN"] = len(top_watchlist)
 
     run_summary = _build_run_summary(
         today,
@@ -621,26 +727,12 @@ def run(params: RunParams) -> int:
         week52_warnings,
     )
     persist.write_json(run_summary, output_dir / "run_summary.json")
-    raw_watchlist_records = watchlist_table.to_dict(orient="records")
-    watchlist_records: list[Dict[str, object]] = []
-    for idx, record in enumerate(raw_watchlist_records, start=1):
-        cleaned = dict(record)
-        cleaned["rank"] = idx
-        watchlist_records.append(cleaned)
-    top_symbols_records = [
-        {
-            "rank": record.get("rank"),
-            "symbol": record.get("symbol"),
-            "score": record.get("score"),
-        }
-        for record in watchlist_records
-    ]
     persist.write_sqlite_outputs(
         run_date=today,
         generated_at=generated_at,
         full_watchlist=full_watchlist,
-        top_n_records=top_symbols_records,
-        watchlist_records=watchlist_records,
+        top_n_records=top_watchlist.top_n_records(),
+        watchlist_records=top_watchlist.records(),
         run_summary=run_summary,
     )
     summary_line = (
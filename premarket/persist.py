@@ -3,24 +3,76 @@
 from __future__ import annotations
 
 import json
+import math
 import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Iterable
-from typing import Any, Dict, Sequence, Tuple
 
 import pandas as pd
 
 from . import utils
 
+try:  # pragma: no cover - optional speedup
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 SQLITE_DB_PATH = Path("premarket.db")
 
+# WAL with synchronous=NORMAL lets the single write transaction below commit
+# with one fsync instead of one per DELETE/INSERT statement.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _json_safe(obj: Any) -> Any:
+    """Replace non-finite floats with ``None``, as orjson does."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _json_safe(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_safe(value) for value in obj]
+    return obj
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON, preferring orjson when installed.
+
+    The stdlib fallback is configured to produce the same bytes: NaN and
+    infinity become ``null`` and non-indented output is compact.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        _json_safe(obj),
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def write_json(obj: Any, path: Path) -> None:
     """Write a JSON object to disk."""
     utils.ensure_directory(path.parent)
-    with path.open("w", encoding="utf-8") as fh:
-        json.dump(obj, fh, indent=2, ensure_ascii=False)
+    path.write_bytes(_dumps(obj, indent=True))
 
 
 def write_csv(df: pd.DataFrame, path: Path) -> None:
@@ -29,6 +81,47 @@ def write_csv(df: pd.DataFrame, path: Path) -> None:
     df.to_csv(path, index=False)
 
 
+_JSON_OUTPUTS = ("full_watchlist.json", "topN.json", "run_summary.json")
+
+
+def write_outputs(
+    output_dir: Path,
+    full_watchlist: Any,
+    top_n: Any,
+    watchlist_df: pd.DataFrame,
+) -> float:
+    """Write the watchlist artifacts into ``output_dir`` and return the seconds taken.
+
+    Both JSON payloads are encoded before any file is touched, so an encoding
+    error cannot leave a half-written set of outputs behind. The three writes
+    are independent and run concurrently; the first failure is re-raised once
+    every write has finished. ``run_summary.json`` is written separately with
+    :func:`write_json` so it can record the elapsed time.
+    """
+    start = time.perf_counter()
+    utils.ensure_directory(output_dir)
+    payloads = {
+        name: _dumps(obj, indent=True)
+        for name, obj in zip(_JSON_OUTPUTS, (full_watchlist, top_n))
+    }
+    with ThreadPoolExecutor(max_workers=len(payloads) + 1) as executor:
+        futures = [
+            executor.submit((output_dir / name).write_bytes, payload)
+            for name, payload in payloads.items()
+        ]
+        futures.append(
+            executor.submit(watchlist_df.to_csv, output_dir / "watchlist.csv", index=False)
+        )
+    for future in futures:
+        future.result()
+    return time.perf_counter() - start
+
+
+def load_outputs(output_dir: Path) -> Dict[str, Any]:
+    """Load the JSON artifacts written by :func:`write_outputs`, keyed by file stem."""
+    return {Path(name).stem: _loads((output_dir / name).read_bytes()) for name in _JSON_OUTPUTS}
+
+
 def _ensure_schema(conn: sqlite3.Connection) -> None:
     conn.execute(
         """
@@ -126,7 +219,7 @@ def _clear_table(conn: sqlite3.Connection, table: str, run_date: str) -> None:
 def _json_or_none(value: Any) -> str | None:
     if value is None:
         return None
-    return json.dumps(value, ensure_ascii=False)
+    return _dumps(value).decode("utf-8")
 
 
 def _prepare_full_watchlist_rows(
@@ -252,113 +345,124 @@ def write_sqlite_outputs(
     watch_rows = _prepare_watchlist_rows(run_date, generated_at, watchlist_records)
     summary_row = _prepare_summary_row(run_date, generated_at, run_summary)
 
-    with sqlite3.connect(path) as conn:
-        _ensure_schema(conn)
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            _ensure_schema(conn)
+
+            _clear_table(conn, "full_watchlist", run_date)
+            if full_rows:
+                conn.executemany(
+                    """
+                    INSERT INTO full_watchlist (
+                        run_date,
+                        generated_at,
+                        symbol,
+                        company,
+                        sector,
+                        industry,
+                        exchange,
+                        market_cap,
+                        pe,
+                        price,
+                        change_pct,
+                        gap_pct,
+                        volume,
+                        avg_volume_3m,
+                        rel_volume,
+                        float_shares,
+                        short_float_pct,
+                        after_hours_change_pct,
+                        week52_range,
+                        week52_pos,
+                        earnings_date,
+                        analyst_recom,
+                        features_json,
+                        score,
+                        tier,
+                        tags_json,
+                        rejection_reasons_json,
+                        insider_transactions,
+                        institutional_transactions
+                    ) VALUES (
+                        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+                    )
+                    """,
+                    full_rows,
+                )
 
-        _clear_table(conn, "full_watchlist", run_date)
-        if full_rows:
-            conn.executemany(
-                """
-                INSERT INTO full_watchlist (
-                    run_date,
-                    generated_at,
-                    symbol,
-                    company,
-                    sector,
-                    industry,
-                    exchange,
-                    market_cap,
-                    pe,
-                    price,
-                    change_pct,
-                    gap_pct,
-                    volume,
-                    avg_volume_3m,
-                    rel_volume,
-                    float_shares,
-                    short_float_pct,
-                    after_hours_change_pct,
-                    week52_range,
-                    week52_pos,
-                    earnings_date,
-                    analyst_recom,
-                    features_json,
-                    score,
-                    tier,
-                    tags_json,
-                    rejection_reasons_json,
-                    insider_transactions,
-                    institutional_transactions
-                ) VALUES (
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+            _clear_table(conn, "top_n", run_date)
+            if top_rows:
+                conn.executemany(
+                    """
+                    INSERT INTO top_n (
+                        run_date,
+                        generated_at,
+                        rank,
+                        symbol,
+                        score
+                    ) VALUES (?, ?, ?, ?, ?)
+                    """,
+                    top_rows,
                 )
-                """,
-                full_rows,
-            )
 
-        _clear_table(conn, "top_n", run_date)
-        if top_rows:
-            conn.executemany(
-                """
-                INSERT INTO top_n (
-                    run_date,
-                    generated_at,
-                    rank,
-                    symbol,
-                    score
-                ) VALUES (?, ?, ?, ?, ?)
-                """,
-                top_rows,
-            )
+            _clear_table(conn, "watchlist", run_date)
+            if watch_rows:
+                conn.executemany(
+                    """
+                    INSERT INTO watchlist (
+                        run_date,
+                        generated_at,
+                        rank,
+                        symbol,
+                        score,
+                        tier,
+                        gap_pct,
+                        rel_volume,
+                        tags_json,
+                        why,
+                        top_feature1,
+                        top_feature2,
+                        top_feature3,
+                        top_feature4,
+                        top_feature5
+                    ) VALUES (
+                        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+                    )
+                    """,
+                    watch_rows,
+                )
 
-        _clear_table(conn, "watchlist", run_date)
-        if watch_rows:
-            conn.executemany(
+            _clear_table(conn, "run_summary", run_date)
+            conn.execute(
                 """
-                INSERT INTO watchlist (
+                INSERT INTO run_summary (
                     run_date,
                     generated_at,
-                    rank,
-                    symbol,
-                    score,
-                    tier,
-                    gap_pct,
-                    rel_volume,
-                    tags_json,
-                    why,
-                    top_feature1,
-                    top_feature2,
-                    top_feature3,
-                    top_feature4,
-                    top_feature5
+                    summary_date,
+                    filters_json,
+                    timings_json,
+                    notes_json,
+                    row_counts_json,
+                    tiers_json,
+                    env_overrides_json,
+                    weights_version,
+                    csv_hash,
+                    sector_cap_applied,
+                    used_cached_csv,
+                    week52_warning_count
                 ) VALUES (
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
                 )
                 """,
-                watch_rows,
-            )
-
-        _clear_table(conn, "run_summary", run_date)
-        conn.execute(
-            """
-            INSERT INTO run_summary (
-                run_date,
-                generated_at,
-                summary_date,
-                filters_json,
-                timings_json,
-                notes_json,
-                row_counts_json,
-                tiers_json,
-                env_overrides_json,
-                weights_version,
-                csv_hash,
-                sector_cap_applied,
-                used_cached_csv,
-                week52_warning_count
-            ) VALUES (
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+                summary_row,
             )
-            """,
-            summary_row,
-        )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
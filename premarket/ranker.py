@@ -86,13 +86,12 @@ def compute_score(df: pd.DataFrame, cfg: RankerConfig) -> pd.Series:
         penalties = penalties + _earnings_penalty(df["earnings_date"], today, cfg)
 
     if "pe" in df.columns:
-        pe_penalty = df["pe"].apply(lambda v: cfg.penalties.pe_outlier if (v is None or (isinstance(v, (int, float)) and v > 200)) else 0.0)
-        penalties = penalties + pe_penalty
+        pe = pd.to_numeric(df["pe"], errors="coerce")
+        penalties = penalties + (pe > 200) * cfg.penalties.pe_outlier
     else:
         penalties = penalties + cfg.penalties.pe_outlier
 
-    capped_penalties = penalties.map(lambda val: min(val, cfg.caps.max_single_negative))
-    scores = scores - capped_penalties
+    scores = scores - penalties.clip(upper=cfg.caps.max_single_negative)
     return scores
 
 
@@ -136,8 +135,10 @@ def apply_sector_diversity(
     counts: dict[str, int] = {}
     selected_indices: list[int] = []
 
-    for idx, row in df.iterrows():
-        sector = row.get("sector")
+    # Walk the already-ranked index with only the sector column materialized;
+    # the scan stops as soon as ``top_n`` rows are picked.
+    sectors = df["sector"].tolist() if "sector" in df.columns else [None] * len(df)
+    for idx, sector in zip(df.index, sectors):
         if pd.isna(sector) or sector is None or sector == "":
             selected_indices.append(idx)
         else:
@@ -5,17 +5,29 @@ from __future__ import annotations
 import json
 import logging
 import os
+import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable, Optional
 
 from dateutil import tz
 from rich.logging import RichHandler
-from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+try:  # pragma: no cover - optional speedup
+    from fastnumbers import fast_float
+except ImportError:  # pragma: no cover - optional speedup
+    fast_float = None
 
 DEFAULT_TZ_NAME = "America/New_York"
 EASTERN = tz.gettz(DEFAULT_TZ_NAME)
 
+_LOGGING_STATE: Optional[tuple[Optional[Path], list[logging.Handler]]] = None
+
+_QUERY_PAIR_RE = re.compile(r"([^&=]+)(?:=([^&]*))?")
+_INLINE_COMMENT_RE = re.compile(r"\s#")
+_WRAPPING_QUOTES_RE = re.compile(r"([\"'])(.*)\1", re.DOTALL)
+
 
 def configure_timezone(tz_name: str) -> None:
     """Configure the default timezone used across the project."""
@@ -43,7 +55,18 @@ def timestamp_iso(dt: Optional[datetime] = None) -> str:
 
 
 def setup_logging(log_file: Optional[Path] = None) -> logging.Logger:
-    """Configure logging with Rich formatting."""
+    """Configure logging with Rich formatting.
+
+    Repeated calls for the same ``log_file`` reuse the handlers installed by
+    the previous call as long as they are still attached to the root logger.
+    """
+    global _LOGGING_STATE
+    root = logging.getLogger()
+    if _LOGGING_STATE is not None:
+        configured_file, configured_handlers = _LOGGING_STATE
+        if configured_file == log_file and root.handlers == configured_handlers:
+            return logging.getLogger("premarket")
+
     handlers: list[logging.Handler] = [RichHandler(rich_tracebacks=True)]
     if log_file is not None:
         ensure_directory(log_file.parent)
@@ -60,6 +83,7 @@ def setup_logging(log_file: Optional[Path] = None) -> logging.Logger:
         handlers=handlers,
         force=True,
     )
+    _LOGGING_STATE = (log_file, list(root.handlers))
     return logging.getLogger("premarket")
 
 
@@ -71,6 +95,22 @@ _FINVIZ_SUFFIX_MULTIPLIERS = {
 }
 
 
+_NA_TOKENS = frozenset({"N/A", "NA", "-"})
+_DROP_NUMERIC_CHARS = str.maketrans("", "", ",$")
+
+
+def _parse_float(text: str) -> Optional[float]:
+    """``float(text)`` that returns ``None`` instead of raising."""
+
+    if fast_float is not None:
+        # Parses C-side without paying for a raised ValueError on bad input.
+        return fast_float(text, on_fail=None, allow_underscores=True)
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
 def _coerce_numeric(value: Any) -> Optional[float]:
     """Coerce Finviz style numbers that may include suffixes into floats."""
 
@@ -90,8 +130,7 @@ def _coerce_numeric(value: Any) -> Optional[float]:
     if not stripped:
         return None
 
-    upper = stripped.upper()
-    if upper in {"N/A", "NA", "-"}:
+    if stripped.upper() in _NA_TOKENS:
         return None
 
     negative = False
@@ -112,13 +151,12 @@ def _coerce_numeric(value: Any) -> Optional[float]:
             multiplier = _FINVIZ_SUFFIX_MULTIPLIERS[suffix]
             stripped = stripped[:-1]
 
-    stripped = stripped.replace(",", "").replace("$", "")
+    stripped = stripped.translate(_DROP_NUMERIC_CHARS)
     if not stripped:
         return None
 
-    try:
-        numeric = float(stripped)
-    except ValueError:
+    numeric = _parse_float(stripped)
+    if numeric is None:
         return None
 
     if negative:
@@ -131,19 +169,13 @@ def _coerce_numeric(value: Any) -> Optional[float]:
 def safe_float(value: Any) -> Optional[float]:
     """Parse a value into float where possible."""
 
-    numeric = _coerce_numeric(value)
-    if numeric is None:
-        return None
-    return float(numeric)
+    return _coerce_numeric(value)
 
 
 def safe_percent(value: Any) -> Optional[float]:
     """Parse percent values (with % sign) into floats."""
 
-    result = safe_float(value)
-    if result is None:
-        return None
-    return result
+    return _coerce_numeric(value)
 
 
 def safe_int(value: Any) -> Optional[int]:
@@ -175,31 +207,30 @@ def read_json(path: Path) -> Any:
         return json.load(fh)
 
 
-def redact_token(url: str) -> str:
-    """Redact sensitive query parameters from a URL for logging."""
+def _mask_query_pair(match: re.Match[str]) -> str:
+    key, value = match.group(1), match.group(2)
+    if key.lower() == "auth":
+        return f"{key}=***"
+    return f"{key}=<redacted>" if value else key
 
-    if not url:
-        return url
 
-    try:
-        parsed = urlsplit(url)
-    except ValueError:
-        return url
+def redact_token(url: str) -> str:
+    """Redact sensitive query parameters from a URL for logging.
 
-    query_pairs = parse_qsl(parsed.query, keep_blank_values=True)
-    if not query_pairs:
-        return urlunsplit((parsed.scheme, parsed.netloc, parsed.path, "", parsed.fragment))
+    Keys are matched as written (not percent-decoded) and everything outside
+    the masked values, including empty ``&&`` segments, is kept verbatim.
+    """
 
-    masked_pairs: list[str] = []
-    for key, value in query_pairs:
-        if key.lower() == "auth":
-            masked_pairs.append(f"{key}=***")
-        else:
-            placeholder = "<redacted>" if value else ""
-            masked_pairs.append(f"{key}={placeholder}" if placeholder else key)
+    if not url or "?" not in url:
+        return url
 
-    masked_query = "&".join(masked_pairs)
-    return urlunsplit((parsed.scheme, parsed.netloc, parsed.path, masked_query, parsed.fragment))
+    head, hash_sep, fragment = url.partition("#")
+    base, query_sep, query = head.partition("?")
+    if not query_sep:
+        return url
+    masked_query = _QUERY_PAIR_RE.sub(_mask_query_pair, query)
+    prefix = f"{base}?{masked_query}" if masked_query else base
+    return f"{prefix}{hash_sep}{fragment}"
 
 
 def env_str(key: str, default: Optional[str] = None) -> Optional[str]:
@@ -217,32 +248,36 @@ def env_str(key: str, default: Optional[str] = None) -> Optional[str]:
     if value is None:
         return default
 
+    parsed = _parse_env_value(value)
+    return default if parsed is None else parsed
+
+
+@lru_cache(maxsize=256)
+def _parse_env_value(value: str) -> Optional[str]:
+    """Parse a raw environment value; ``None`` means "treat as unset"."""
+
     stripped = value.strip()
     if not stripped or stripped.startswith("#"):
-        return default
-
-    comment_index: Optional[int] = None
-    for idx, char in enumerate(stripped):
-        if char == "#" and (idx == 0 or stripped[idx - 1].isspace()):
-            comment_index = idx
-            break
+        return None
 
-    if comment_index is not None:
-        stripped = stripped[:comment_index].rstrip()
+    # Common case first: a plain value with no comment marker or quotes.
+    if "#" not in stripped and stripped[0] not in "\"'" and stripped[-1] not in "\"'":
+        return stripped
 
-    if not stripped:
-        return default
+    comment = _INLINE_COMMENT_RE.search(stripped)
+    if comment is not None:
+        stripped = stripped[: comment.start()].rstrip()
 
-    if stripped[0] in {'"', "'"} and stripped[-1] == stripped[0]:
-        stripped = stripped[1:-1]
+    quoted = _WRAPPING_QUOTES_RE.fullmatch(stripped)
+    if quoted is not None:
+        stripped = quoted.group(2)
     else:
         if stripped and stripped[0] in {'"', "'"} and stripped.count(stripped[0]) == 1:
             stripped = stripped[1:]
         if stripped and stripped[-1] in {'"', "'"} and stripped.count(stripped[-1]) == 1:
             stripped = stripped[:-1]
 
-
-    return stripped or default
+    return stripped or None
 
 
 def ensure_iterable(obj: Optional[Iterable[str]]) -> list[str]:
@@ -19,3 +19,17 @@ class Response:
 
 def get(url: str, timeout: int = 10) -> Response:
     raise RequestException("Network access disabled in test environment")
+
+
+class Session:
+    def __init__(self) -> None:
+        self.adapters: dict[str, object] = {}
+
+    def mount(self, prefix: str, adapter: object) -> None:
+        self.adapters[prefix] = adapter
+
+    def get(self, url: str, timeout: int = 10, **kwargs: object) -> Response:
+        return get(url, timeout=timeout)
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,10 @@
+"""Minimal requests.adapters stub."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class HTTPAdapter:
+    def __init__(self, **kwargs: Any) -> None:
+        self.config = kwargs
@@ -1,22 +1,30 @@
+import io
+import os
+
+import pytest
+
 from premarket import loader_finviz
 
 
-def test_http_get_falls_back_to_urllib(monkeypatch):
-    def fail_with_stub(_url: str) -> str:
+def test_http_download_falls_back_to_urllib(monkeypatch, tmp_path):
+    out_path = tmp_path / "finviz_elite.csv"
+
+    def fail_with_stub(_url: str, _out_path) -> None:
         raise loader_finviz.requests.RequestException(
             "Network access disabled in test environment"
         )
 
-    def succeed_with_urllib(url: str) -> str:
+    def succeed_with_urllib(url: str, path) -> None:
         assert url == "https://example.com/export"
-        return "ok"
+        loader_finviz._stream_to_path(io.BytesIO(b"ok"), path)
 
     monkeypatch.setattr(loader_finviz, "_fetch_with_requests", fail_with_stub)
     monkeypatch.setattr(loader_finviz, "_fetch_with_urllib", succeed_with_urllib)
 
-    result = loader_finviz._http_get("https://example.com/export")
+    result = loader_finviz._http_download("https://example.com/export", out_path)
 
-    assert result == "ok"
+    assert result == out_path
+    assert out_path.read_bytes() == b"ok"
 
 
 def test_download_csv_overwrites_existing_file(tmp_path, monkeypatch):
@@ -24,13 +32,69 @@ def test_download_csv_overwrites_existing_file(tmp_path, monkeypatch):
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out_path.write_text("old", encoding="utf-8")
 
-    def fake_http_get(url: str) -> str:
+    def fake_fetch(url: str, path) -> None:
         assert url == "https://example.com/export"
-        return "new"
+        loader_finviz._stream_to_path(io.BytesIO(b"new"), path)
 
-    monkeypatch.setattr(loader_finviz, "_http_get", fake_http_get)
+    monkeypatch.setattr(loader_finviz, "_fetch_with_requests", fake_fetch)
 
     result = loader_finviz.download_csv("https://example.com/export", out_path, use_cache=True)
 
     assert result == out_path
     assert out_path.read_text(encoding="utf-8") == "new"
+
+
+def test_stream_to_path_keeps_previous_file_on_failure(tmp_path):
+    out_path = tmp_path / "finviz_elite.csv"
+    out_path.write_text("old", encoding="utf-8")
+
+    class BrokenStream(io.BytesIO):
+        def read(self, *_args):
+            raise OSError("connection reset")
+
+    with pytest.raises(OSError):
+        loader_finviz._stream_to_path(BrokenStream(), out_path)
+
+    assert out_path.read_text(encoding="utf-8") == "old"
+    assert list(tmp_path.iterdir()) == [out_path]
+
+
+def test_latest_cached_file_picks_newest_dated_export(tmp_path):
+    for day in ("2024-01-01", "2024-01-03"):
+        folder = tmp_path / day
+        folder.mkdir()
+        (folder / "finviz_elite.csv").write_text("x", encoding="utf-8")
+    (tmp_path / "2024-01-05").mkdir()
+
+    latest, modified = loader_finviz._latest_cached_file(tmp_path)
+    assert latest == tmp_path / "2024-01-03" / "finviz_elite.csv"
+    assert modified == latest.stat().st_mtime
+    assert loader_finviz._latest_cached_file(tmp_path / "missing") is None
+
+
+def test_download_csv_falls_back_to_fresh_cache_only(tmp_path, monkeypatch):
+    cached = tmp_path / "2024-01-01" / "finviz_elite.csv"
+    cached.parent.mkdir()
+    cached.write_text("cached", encoding="utf-8")
+    out_path = tmp_path / "2024-01-02" / "finviz_elite.csv"
+
+    def fail(_url: str, _path) -> None:
+        raise loader_finviz.requests.RequestException("HTTP 500")
+
+    monkeypatch.setattr(loader_finviz, "_http_download", fail)
+    monkeypatch.setattr(loader_finviz, "_cache_ttl_minutes", lambda: 60)
+
+    assert loader_finviz.download_csv("https://example.com/export", out_path, use_cache=True) == cached
+
+    stale = loader_finviz.time.time() - 2 * 3600
+    os.utime(cached, (stale, stale))
+    with pytest.raises(RuntimeError):
+        loader_finviz.download_csv("https://example.com/export", out_path, use_cache=True)
+    assert not out_path.parent.exists()
+
+
+def test_read_csv_accepts_bytes_buffer():
+    df = loader_finviz.read_csv(io.BytesIO(b"Ticker,Price\nAAA,1.5\n"))
+
+    assert list(df.columns) == ["Ticker", "Price"]
+    assert str(df.loc[0, "Ticker"]) == "AAA"
@@ -1,6 +1,9 @@
+from datetime import date, datetime
+from io import BytesIO
+
 import pandas as pd
 
-from premarket import normalize
+from premarket import loader_finviz, normalize
 
 
 def test_normalize_columns_and_types():
@@ -59,3 +62,92 @@ def test_coerce_types_parses_suffixes():
     assert coerced.loc[0, "float_pct"] == 65.0
     assert coerced.loc[0, "short_float_pct"] == 12.5
     assert warnings == 0
+
+
+def test_coerce_types_handles_missing_and_signed_values():
+    df = pd.DataFrame(
+        {
+            "Ticker": ["AAA", "BBB", "CCC"],
+            "Price": ["(5.2)", "+3", "-"],
+            "Volume": ["1,000", "N/A", "2.5K"],
+            "Previous Close": ["4", "0", "1"],
+        }
+    )
+
+    normalized = normalize.normalize_columns(df)
+    coerced, _ = normalize.coerce_types(normalized)
+
+    assert coerced.loc[0, "price"] == -5.2
+    assert coerced.loc[1, "price"] == 3.0
+    assert pd.isna(coerced.loc[2, "price"])
+    assert coerced.loc[0, "volume"] == 1_000
+    assert pd.isna(coerced.loc[1, "volume"])
+    assert coerced.loc[2, "volume"] == 2_500
+    assert round(coerced.loc[0, "gap_pct"], 2) == round((-5.2 - 4) / 4 * 100, 2)
+    assert pd.isna(coerced.loc[1, "gap_pct"])
+
+
+def test_coerce_types_accepts_typed_earnings_dates():
+    df = pd.DataFrame({"Ticker": ["AAA", "BBB"], "Earnings Date": [date(2024, 1, 2), "2024-01-03"]})
+
+    coerced, _ = normalize.coerce_types(normalize.normalize_columns(df))
+
+    assert coerced.loc[0, "earnings_date"] == datetime(2024, 1, 2)
+    assert coerced.loc[1, "earnings_date"] == datetime(2024, 1, 3)
+
+
+def test_coerce_types_treats_blank_csv_dates_as_missing():
+    raw = loader_finviz.read_csv(BytesIO(b"Ticker,Price,Earnings Date\nAAA,10,2024-01-02\nBBB,11,\n"))
+
+    coerced, _ = normalize.coerce_types(normalize.normalize_columns(raw))
+
+    assert coerced.loc[0, "earnings_date"] == datetime(2024, 1, 2)
+    assert pd.isna(coerced.loc[1, "earnings_date"])
+
+
+def test_coerce_types_keeps_blank_csv_ranges_missing():
+    raw = loader_finviz.read_csv(BytesIO(b"Ticker,Price,52-Week Range\nAAA,10,5 - 20\nBBB,11,\n"))
+
+    coerced, warnings = normalize.coerce_types(normalize.normalize_columns(raw))
+
+    blank = coerced.loc[1, "week52_range"]
+    assert pd.isna(blank) or blank in ("", "nan")
+    assert coerced.loc[1, "week52_pos"] == 0.5
+    assert warnings == 1
+
+
+def test_week52_warnings_count_unusable_ranges():
+    df = pd.DataFrame(
+        {
+            "price": [15.0, 15.0, 15.0, 30.0],
+            "week52_range": ["10 - 20", "20 - 10", "n/a", "10 - 20"],
+        }
+    )
+
+    positions, warnings = normalize.compute_week52_pos(df)
+
+    assert warnings == 2
+    assert positions.tolist() == [0.5, 0.5, 0.5, 1.0]
+
+
+def test_week52_pos_handles_non_finite_bounds_and_bad_prices():
+    df = pd.DataFrame(
+        {
+            "price": ["10", "10", "abc"],
+            "week52_range": ["nan - 10", "5 - inf", "5 - 20"],
+        }
+    )
+
+    positions, warnings = normalize.compute_week52_pos(df)
+
+    # A NaN bound parses, so it yields a NaN position rather than a warning.
+    assert pd.isna(positions[0])
+    assert positions[1] == 0.0
+    assert positions[2] == 0.5
+    assert warnings == 1
+
+
+def test_normalize_columns_returns_canonical_frames_unchanged():
+    df = pd.DataFrame({"ticker": ["AAA"], "rel_volume": ["1.8"], "price": ["18.5"]})
+
+    assert normalize.normalize_columns(df) is df
@@ -1,12 +1,14 @@
 import json
+import os
 import sqlite3
 from pathlib import Path
 
 from datetime import date
 
 import pandas as pd
+import pytest
 
-from premarket import orchestrate
+from premarket import orchestrate, persist, ranker
 
 
 def _sample_csv(path: Path) -> None:
@@ -94,17 +96,27 @@ def _sample_csv(path: Path) -> None:
     df.to_csv(path, index=False)
 
 
-def test_orchestrate_end_to_end(tmp_path, monkeypatch):
+@pytest.fixture(scope="module")
+def sample_csv(tmp_path_factory) -> Path:
+    path = tmp_path_factory.mktemp("finviz") / "finviz.csv"
+    _sample_csv(path)
+    return path
+
+
+@pytest.fixture(scope="module", autouse=True)
+def finviz_env():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("FINVIZ_EXPORT_URL", "https://example.com/export")
+        mp.setenv("CACHE_TTL_MIN", "1440")
+        yield
+
+
+def test_orchestrate_end_to_end(tmp_path, monkeypatch, sample_csv):
     db_path = Path("premarket.db")
     if db_path.exists():
         db_path.unlink()
 
-    csv_path = tmp_path / "finviz.csv"
-    _sample_csv(csv_path)
-
-    monkeypatch.setenv("FINVIZ_EXPORT_URL", "https://example.com/export")
-    monkeypatch.setenv("CACHE_TTL_MIN", "1440")
-
+    csv_path = sample_csv
     monkeypatch.setattr(orchestrate.loader_finviz, "download_csv", lambda url, out_path, use_cache: csv_path)
 
     run_date = date(2024, 1, 2)
@@ -132,7 +144,8 @@ def test_orchestrate_end_to_end(tmp_path, monkeypatch):
     assert (out_dir / "run_summary.json").exists()
     assert rejection_path.exists()
 
-    topn = json.loads((out_dir / "topN.json").read_text())
+    outputs = persist.load_outputs(out_dir)
+    topn = outputs["topN"]
     assert topn["top_n"] == 2
     assert len(topn["symbols"]) == 2
     top_symbols_list = topn["symbols"]
@@ -141,9 +154,10 @@ def test_orchestrate_end_to_end(tmp_path, monkeypatch):
     assert "Why" in watchlist_df.columns
     assert "TopFeature5" in watchlist_df.columns
 
-    run_summary = json.loads((out_dir / "run_summary.json").read_text())
+    run_summary = outputs["run_summary"]
     assert run_summary["row_counts"]["topN"] == 2
     assert "csv_hash" in run_summary
+    assert set(run_summary["timings_sec"]) == {"download", "normalize", "score", "persist"}
     assert run_summary["env_overrides_used"] == sorted(params.env_overrides)
 
     rejected_df = pd.read_csv(rejection_path)
@@ -207,7 +221,6 @@ def test_run_emits_empty_outputs_when_download_fails(tmp_path, monkeypatch):
     if db_path.exists():
         db_path.unlink()
 
-    monkeypatch.setenv("FINVIZ_EXPORT_URL", "https://example.com/export")
     out_base = tmp_path / "out"
     run_date = date(2024, 1, 2)
 
@@ -258,3 +271,60 @@ def test_run_emits_empty_outputs_when_download_fails(tmp_path, monkeypatch):
         assert summary_row is not None
         payload = json.loads(summary_row[0])
         assert payload["topN"] == 0
+
+
+def test_load_config_reparses_only_after_edit(tmp_path):
+    cfg_path = tmp_path / "strategy.yaml"
+    cfg_path.write_text(Path("config/strategy.yaml").read_text())
+    orchestrate._read_config_data.cache_clear()
+
+    first = orchestrate._load_config(cfg_path)
+    second = orchestrate._load_config(cfg_path)
+    assert first is not second
+    assert orchestrate._read_config_data.cache_info().misses == 1
+
+    stat = cfg_path.stat()
+    os.utime(cfg_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    orchestrate._load_config(cfg_path)
+    assert orchestrate._read_config_data.cache_info().misses == 2
+
+
+def test_top_n_watchlist_explains_scores_columnwise():
+    weights = ranker.RankerWeights(
+        relvol=0.5,
+        gap=0.25,
+        avgvol=0.0,
+        float_band=0.0,
+        short_float=0.0,
+        after_hours=0.0,
+        change=0.0,
+        w52pos=1.0,
+        news_fresh=0.0,
+        analyst=0.0,
+        insider_inst=0.0,
+    )
+    df = pd.DataFrame(
+        {
+            "ticker": ["AAA", "BBB"],
+            "score": [80.0, 40.0],
+            "tier": ["A", "C"],
+            "gap_pct": [12.0, 3.0],
+            "rel_volume": [4.0, 1.5],
+            "tags": [["EXTREME_GAP"], []],
+            "f_relvol": [1.0, float("nan")],
+            "f_gap": [0.4, 0.0],
+        }
+    )
+
+    watchlist = orchestrate.TopNWatchlist.from_frame(df, weights)
+
+    assert watchlist.why == ["RelVol + Gap", "—"]
+    records = watchlist.records()
+    assert list(records[0]) == orchestrate.WATCHLIST_COLUMNS
+    assert [record["rank"] for record in records] == [1, 2]
+    assert records[0]["TopFeature1"] == "RelVol=0.500"
+    assert records[0]["TopFeature2"] == "Gap=0.100"
+    assert records[1]["TopFeature1"] == "RelVol=0.000"
+    assert records[1]["TopFeature3"] == ""
+    assert watchlist.top_n_records()[1] == {"rank": 2, "symbol": "BBB", "score": 40.0}
+    assert list(watchlist.table().columns) == orchestrate.WATCHLIST_COLUMNS
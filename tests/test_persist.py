@@ -0,0 +1,25 @@
+import pytest
+
+from premarket import persist
+
+
+def test_dumps_fallback_writes_non_finite_floats_as_null(monkeypatch):
+    monkeypatch.setattr(persist, "orjson", None)
+
+    payload = {"pe": float("nan"), "values": [1.5, float("inf")], "tags": ("A",)}
+
+    assert persist._dumps(payload) == b'{"pe":null,"values":[1.5,null],"tags":["A"]}'
+    assert persist._dumps(payload, indent=True) == (
+        b'{\n  "pe": null,\n  "values": [\n    1.5,\n    null\n  ],\n  "tags": [\n    "A"\n  ]\n}'
+    )
+
+
+@pytest.mark.parametrize("indent", [False, True])
+def test_dumps_matches_orjson(monkeypatch, indent):
+    pytest.importorskip("orjson")
+    payload = {"symbol": "ÅBC", "pe": float("nan"), "features": {"gap": 0.25}, "tags": []}
+
+    fast = persist._dumps(payload, indent=indent)
+    monkeypatch.setattr(persist, "orjson", None)
+
+    assert persist._dumps(payload, indent=indent) == fast
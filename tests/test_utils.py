@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import logging
+
 from premarket import utils
 
 
@@ -48,3 +50,44 @@ def test_env_str_discards_dangling_quote_after_comment(monkeypatch):
     monkeypatch.setenv("DANGLING", 'data/watchlists"      # auto-appends')
     assert utils.env_str("DANGLING") == "data/watchlists"
 
+
+def test_redact_token_masks_auth_and_query_values():
+    url = "https://elite.finviz.com/export.ashx?v=111&f=&AUTH=secret#top"
+    assert utils.redact_token(url) == (
+        "https://elite.finviz.com/export.ashx?v=<redacted>&f&AUTH=***#top"
+    )
+    assert utils.redact_token("https://example.com/path") == "https://example.com/path"
+    assert utils.redact_token("https://example.com/path?#frag") == "https://example.com/path#frag"
+
+
+def test_setup_logging_reuses_handlers_for_same_file(tmp_path, monkeypatch):
+    root = logging.getLogger()
+    original_handlers = list(root.handlers)
+    original_level = root.level
+    monkeypatch.setattr(utils, "_LOGGING_STATE", None)
+    try:
+        log_file = tmp_path / "run.log"
+        utils.setup_logging(log_file)
+        first = list(root.handlers)
+
+        utils.setup_logging(log_file)
+        assert root.handlers == first
+
+        utils.setup_logging(tmp_path / "other.log")
+        assert root.handlers != first
+    finally:
+        for handler in root.handlers:
+            if handler not in original_handlers:
+                handler.close()
+        root.handlers[:] = original_handlers
+        root.setLevel(original_level)
+
+
+def test_env_str_parses_each_raw_value_once(monkeypatch):
+    utils._parse_env_value.cache_clear()
+    monkeypatch.setenv("FIRST", "  value  # note")
+    monkeypatch.setenv("SECOND", "  value  # note")
+
+    assert utils.env_str("FIRST") == "value"
+    assert utils.env_str("SECOND") == "value"
+    assert utils._parse_env_value.cache_info().misses == 1